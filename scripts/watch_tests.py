@@ -14,6 +14,20 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _load_report(path: Path) -> dict:
+    """Parse a JSON test report, using orjson when available (2-5x faster
+    than stdlib json on large reports with embedded tracebacks)."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class TestWatcher:
     """Continuous test runner with metrics collection."""
@@ -25,6 +39,19 @@ class TestWatcher:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.run_count = 0
         self.results_history = []
+        self._metrics_fh = None
+
+    @staticmethod
+    def _run_streamed(cmd: list, log_path: Path) -> int:
+        """Run a command with output streamed straight to a log file.
+
+        capture_output=True buffered the full verbose test output in memory;
+        piping to a file keeps memory constant and preserves the output for
+        debugging.
+        """
+        with open(log_path, "wb") as log_fh:
+            proc = subprocess.Popen(cmd, stdout=log_fh, stderr=subprocess.STDOUT)
+            return proc.wait()
 
     def run_pytest(self) -> dict:
         """Run pytest and capture results."""
@@ -44,14 +71,14 @@ class TestWatcher:
             cmd.extend(["-m", self.suite])
 
         start_time = time.time()
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        return_code = self._run_streamed(cmd, self.output_dir / f"pytest_{timestamp}.log")
         duration = time.time() - start_time
 
         # Parse results
         test_result = {
             "timestamp": timestamp,
             "duration_seconds": round(duration, 2),
-            "return_code": result.returncode,
+            "return_code": return_code,
             "passed": 0,
             "failed": 0,
             "skipped": 0,
@@ -61,13 +88,12 @@ class TestWatcher:
         # Try to parse JSON report
         if json_report.exists():
             try:
-                with open(json_report) as f:
-                    data = json.load(f)
-                    summary = data.get("summary", {})
-                    test_result["passed"] = summary.get("passed", 0)
-                    test_result["failed"] = summary.get("failed", 0)
-                    test_result["skipped"] = summary.get("skipped", 0)
-                    test_result["errors"] = summary.get("error", 0)
+                data = _load_report(json_report)
+                summary = data.get("summary", {})
+                test_result["passed"] = summary.get("passed", 0)
+                test_result["failed"] = summary.get("failed", 0)
+                test_result["skipped"] = summary.get("skipped", 0)
+                test_result["errors"] = summary.get("error", 0)
             except Exception:
                 pass
 
@@ -81,13 +107,13 @@ class TestWatcher:
                str(self.output_dir / f"jest_{timestamp}.json")]
 
         start_time = time.time()
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        return_code = self._run_streamed(cmd, self.output_dir / f"jest_{timestamp}.log")
         duration = time.time() - start_time
 
         test_result = {
             "timestamp": timestamp,
             "duration_seconds": round(duration, 2),
-            "return_code": result.returncode,
+            "return_code": return_code,
             "passed": 0,
             "failed": 0,
         }
@@ -96,10 +122,9 @@ class TestWatcher:
         json_file = self.output_dir / f"jest_{timestamp}.json"
         if json_file.exists():
             try:
-                with open(json_file) as f:
-                    data = json.load(f)
-                    test_result["passed"] = data.get("numPassedTests", 0)
-                    test_result["failed"] = data.get("numFailedTests", 0)
+                data = _load_report(json_file)
+                test_result["passed"] = data.get("numPassedTests", 0)
+                test_result["failed"] = data.get("numFailedTests", 0)
             except Exception:
                 pass
 
@@ -107,8 +132,6 @@ class TestWatcher:
 
     def save_metrics(self, python_result: dict, ts_result: dict):
         """Save aggregated metrics to file."""
-        metrics_file = self.output_dir / "metrics_history.jsonl"
-
         metrics = {
             "run_number": self.run_count,
             "timestamp": datetime.now().isoformat(),
@@ -120,8 +143,15 @@ class TestWatcher:
             ),
         }
 
-        with open(metrics_file, "a") as f:
-            f.write(json.dumps(metrics) + "\n")
+        # Keep the history file open across runs; one append + flush per run
+        # instead of an open/close cycle, with orjson when available.
+        if self._metrics_fh is None:
+            self._metrics_fh = open(self.output_dir / "metrics_history.jsonl", "ab")
+        if orjson is not None:
+            self._metrics_fh.write(orjson.dumps(metrics) + b"\n")
+        else:
+            self._metrics_fh.write(json.dumps(metrics).encode() + b"\n")
+        self._metrics_fh.flush()
 
         self.results_history.append(metrics)
 
@@ -176,6 +206,10 @@ class TestWatcher:
             print("\n\nStopping test watcher...")
             print(f"Total runs: {self.run_count}")
             print(f"Results saved to: {self.output_dir}")
+        finally:
+            if self._metrics_fh is not None:
+                self._metrics_fh.close()
+                self._metrics_fh = None
 
 
 def main():
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+AIOBS Pytest Daemon
+Long-lived pytest worker used by the test orchestrator in continuous mode
+
+Reads one JSON request per line on stdin ({"args": [...]}) and runs
+pytest.main(args) in-process, so repeated iterations skip interpreter
+startup and plugin loading. Emits one JSON result line per run on
+stdout: {"exit_code": ..., "output": ...} with the captured output tail.
+"""
+import contextlib
+import io
+import json
+import sys
+
+# Keep at most this much captured output per run; the orchestrator only
+# parses the summary at the tail
+_OUTPUT_TAIL_CHARS = 65536
+
+
+def main() -> int:
+    import pytest
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+                exit_code = int(pytest.main(request["args"]))
+            result = {"exit_code": exit_code, "output": buf.getvalue()[-_OUTPUT_TAIL_CHARS:]}
+        except Exception as e:  # Malformed request or pytest crash
+            result = {"exit_code": 1, "output": f"Daemon error: {e}"}
+
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ from .data_generator import (
     GeneratedLog,
     GeneratedMetric,
     GeneratedPrediction,
+    MetricBatch,
     MetricType,
     PatternGenerator,
     ScenarioGenerator,
@@ -23,6 +24,7 @@ __all__ = [
     "GeneratedLog",
     "GeneratedEvent",
     "GeneratedPrediction",
+    "MetricBatch",
     "EventType",
     "MetricType",
 ]
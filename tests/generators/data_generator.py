@@ -4,17 +4,25 @@ AIOBS Continuous Data Generator
 Generates realistic test data for continuous testing and simulation
 """
 import asyncio
-import hashlib
 import json
 import math
 import os
 import random
 import sys
-from dataclasses import asdict, dataclass, field
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Callable, Dict, Generator, List
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
@@ -53,6 +61,42 @@ class GeneratedMetric:
     metric_type: MetricType = MetricType.GAUGE
 
 
+@dataclass
+class MetricBatch:
+    """Column-oriented metric batch (structure-of-arrays).
+
+    One contiguous array/list per field instead of one GeneratedMetric
+    object per row; bulk consumers iterate columns without paying a
+    per-row object and dict allocation.
+    """
+
+    names: List[str]
+    values: np.ndarray
+    timestamp: datetime
+    services: List[str]
+    envs: List[str]
+    regions: List[str]
+    metric_types: List[MetricType]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def to_metrics(self) -> List["GeneratedMetric"]:
+        """Expand into row-oriented GeneratedMetric objects."""
+        return [
+            GeneratedMetric(
+                name=name,
+                value=value,
+                timestamp=self.timestamp,
+                labels={"service": service, "env": env, "region": region},
+                metric_type=metric_type,
+            )
+            for name, value, service, env, region, metric_type in zip(
+                self.names, self.values, self.services, self.envs, self.regions, self.metric_types
+            )
+        ]
+
+
 @dataclass
 class GeneratedLog:
     message: str
@@ -99,16 +143,21 @@ class PatternGenerator:
         phase: float = 0,
         offset: float = 0,
     ) -> Callable[[float], float]:
-        """Generate sinusoidal pattern (e.g., daily traffic)"""
+        """Generate sinusoidal pattern (e.g., daily traffic)
+
+        The returned callable is ufunc-based: pass an ndarray of times to
+        evaluate a whole window in one call instead of looping.
+        """
+        omega = 2 * math.pi / period  # hoisted out of the per-call path
 
         def generate(t: float) -> float:
-            return amplitude * math.sin(2 * math.pi * t / period + phase) + offset
+            return amplitude * np.sin(omega * t + phase) + offset
 
         return generate
 
     @staticmethod
     def trend(slope: float = 0.001, intercept: float = 0) -> Callable[[float], float]:
-        """Generate linear trend"""
+        """Generate linear trend (accepts scalars or ndarrays)"""
 
         def generate(t: float) -> float:
             return slope * t + intercept
@@ -128,38 +177,22 @@ class PatternGenerator:
 
         return generate
 
+    # Default seasonal tables, built once at import instead of per call
+    DEFAULT_WEEKLY = (0.8, 1.0, 1.0, 1.0, 1.0, 0.6, 0.5)  # Mon-Sun
+    DEFAULT_HOURLY = (
+        0.3, 0.2, 0.2, 0.2, 0.3, 0.5,  # 0-5
+        0.7, 0.9, 1.0, 1.0, 1.0, 0.9,  # 6-11
+        0.8, 0.9, 1.0, 1.0, 0.9, 0.8,  # 12-17
+        0.7, 0.6, 0.5, 0.5, 0.4, 0.3,  # 18-23
+    )
+
     @staticmethod
     def seasonal(
         weekly_pattern: List[float] = None, hourly_pattern: List[float] = None
     ) -> Callable[[datetime], float]:
         """Generate seasonal patterns"""
-        weekly = weekly_pattern or [0.8, 1.0, 1.0, 1.0, 1.0, 0.6, 0.5]  # Mon-Sun
-        hourly = hourly_pattern or [
-            0.3,
-            0.2,
-            0.2,
-            0.2,
-            0.3,
-            0.5,  # 0-5
-            0.7,
-            0.9,
-            1.0,
-            1.0,
-            1.0,
-            0.9,  # 6-11
-            0.8,
-            0.9,
-            1.0,
-            1.0,
-            0.9,
-            0.8,  # 12-17
-            0.7,
-            0.6,
-            0.5,
-            0.5,
-            0.4,
-            0.3,  # 18-23
-        ]
+        weekly = weekly_pattern or PatternGenerator.DEFAULT_WEEKLY
+        hourly = hourly_pattern or PatternGenerator.DEFAULT_HOURLY
 
         def generate(dt: datetime) -> float:
             day_factor = weekly[dt.weekday()]
@@ -199,6 +232,203 @@ class PatternGenerator:
 # Continuous Data Generator
 # =============================================================================
 
+# Frozen choice pools; random.choice(list(Enum)) rebuilt these per call
+_METRIC_TYPES = tuple(MetricType)
+_EVENT_TYPES = tuple(EventType)
+_ENVIRONMENTS = ("prod", "staging")
+_REGIONS = ("us-east", "us-west", "eu-west")
+
+_EVENT_CONFIGS = {
+    EventType.DEPLOYMENT: {
+        "titles": ("Deployment started", "Deployment completed", "Rollback initiated"),
+        "severities": ("info", "info", "warning"),
+    },
+    EventType.CONFIG_CHANGE: {
+        "titles": ("Config updated", "Feature flag toggled", "Rate limit changed"),
+        "severities": ("info", "info", "warning"),
+    },
+    EventType.ERROR: {
+        "titles": ("Error rate spike", "Failed health check", "Circuit breaker opened"),
+        "severities": ("error", "error", "warning"),
+    },
+    EventType.DRIFT_DETECTED: {
+        "titles": (
+            "Data drift detected",
+            "Concept drift detected",
+            "Prediction drift detected",
+        ),
+        "severities": ("warning", "warning", "error"),
+    },
+    EventType.ANOMALY: {
+        "titles": ("Latency anomaly", "Traffic anomaly", "Error rate anomaly"),
+        "severities": ("warning", "warning", "error"),
+    },
+    EventType.SECURITY: {
+        "titles": (
+            "Suspicious activity detected",
+            "Auth failure spike",
+            "Rate limit exceeded",
+        ),
+        "severities": ("warning", "error", "warning"),
+    },
+}
+# Pre-fill the remaining event types so lookups never fall back to
+# building a default config per event
+for _event_type in EventType:
+    _EVENT_CONFIGS.setdefault(
+        _event_type, {"titles": (f"{_event_type.value} event",), "severities": ("info",)}
+    )
+
+# Metric name -> value family, resolved once here instead of substring
+# scans per generated value
+_METRIC_CATEGORY = {
+    "request_count": "count",
+    "request_latency_ms": "latency",
+    "error_rate": "percent",
+    "cpu_usage_percent": "percent",
+    "memory_usage_percent": "percent",
+    "inference_latency_ms": "latency",
+    "model_accuracy": "other",
+    "trust_score": "score",
+    "drift_score": "score",
+}
+
+# Shared by reference across all generated events; read-only so one
+# consumer mutation cannot corrupt every event (same guard the API test
+# fixtures use for their shared response bodies).
+_EVENT_PAYLOAD = MappingProxyType({"source": "data_generator", "metadata": {"generated": True}})
+
+# Interned sub-second jitter offsets: one table at import instead of a
+# randint plus a timedelta construction per log line
+_MS_OFFSETS = tuple(timedelta(milliseconds=ms) for ms in range(1000))
+
+_LOG_LEVELS = ("info", "warning", "error", "critical")
+_LOG_LEVEL_CUM_WEIGHTS = (0.7, 0.9, 0.98, 1.0)
+
+_LOG_TEMPLATES = {
+    "info": (
+        "Request processed successfully",
+        "Model inference completed",
+        "Cache hit for key {key}",
+        "User {user_id} authenticated",
+        "Batch job started for {job_type}",
+    ),
+    "warning": (
+        "High latency detected: {latency}ms",
+        "Memory usage at {percent}%",
+        "Retry attempt {attempt} for request {request_id}",
+        "Rate limit approaching for {client_id}",
+        "Model confidence below threshold: {confidence}",
+    ),
+    "error": (
+        "Failed to process request: {error}",
+        "Database connection timeout",
+        "Model prediction failed: {reason}",
+        "Invalid input data: {field}",
+        "External API error: {status_code}",
+    ),
+    "critical": (
+        "Service unavailable",
+        "Data corruption detected",
+        "Security breach attempt from {ip}",
+        "Complete outage in {region}",
+    ),
+}
+
+# One sampler per template placeholder, invoked only when a template
+# actually references the field (see _LazyFields).
+_FIELD_SAMPLERS: Dict[str, Callable[[], Any]] = {
+    "key": lambda: f"cache_{random.randint(1, 1000)}",
+    "user_id": lambda: f"user_{random.randint(1, 10000)}",
+    "job_type": lambda: random.choice(("etl", "training", "aggregation")),
+    "latency": lambda: random.randint(100, 5000),
+    "percent": lambda: random.randint(70, 99),
+    "attempt": lambda: random.randint(1, 5),
+    "request_id": lambda: os.urandom(4).hex(),
+    "client_id": lambda: f"client_{random.randint(1, 100)}",
+    "confidence": lambda: round(random.uniform(0.3, 0.6), 2),
+    "error": lambda: random.choice(("timeout", "validation_failed", "auth_error")),
+    "reason": lambda: random.choice(("input_shape_mismatch", "null_features", "oom")),
+    "field": lambda: random.choice(("user_id", "timestamp", "features")),
+    "status_code": lambda: random.choice((500, 502, 503, 504)),
+    "ip": lambda: f"192.168.{random.randint(0, 255)}.{random.randint(0, 255)}",
+    "region": lambda: random.choice(_REGIONS),
+}
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize one record to a newline-terminated JSON line.
+
+    orjson emits bytes directly and is several times faster than stdlib
+    json on these nested dicts; OPT_SERIALIZE_NUMPY keeps np.float64
+    values numeric. The converters below normalize datetimes and enums
+    to strings before serialization so both paths emit identical JSON;
+    default=str is only a last-resort net for unexpected types.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    return (json.dumps(obj, default=str, separators=(",", ":")) + "\n").encode()
+
+
+def _metric_to_dict(m: GeneratedMetric) -> Dict[str, Any]:
+    return {
+        "name": m.name,
+        "value": m.value,
+        "timestamp": m.timestamp.isoformat(),
+        "labels": m.labels,
+        "metric_type": m.metric_type.value,
+    }
+
+
+def _log_to_dict(entry: GeneratedLog) -> Dict[str, Any]:
+    return {
+        "message": entry.message,
+        "level": entry.level,
+        "timestamp": entry.timestamp.isoformat(),
+        "service": entry.service,
+        "context": entry.context,
+    }
+
+
+def _event_to_dict(e: GeneratedEvent) -> Dict[str, Any]:
+    return {
+        "event_id": e.event_id,
+        "event_type": e.event_type.value,
+        "title": e.title,
+        "description": e.description,
+        "timestamp": e.timestamp.isoformat(),
+        "service": e.service,
+        "severity": e.severity,
+        # Shallow copy: the shared payload is a mapping proxy, which the
+        # JSON encoders cannot serialize directly
+        "payload": dict(e.payload),
+    }
+
+
+def _prediction_to_dict(p: GeneratedPrediction) -> Dict[str, Any]:
+    return {
+        "model_id": p.model_id,
+        "input_hash": p.input_hash,
+        "output": p.output,
+        "confidence": p.confidence,
+        "latency_ms": p.latency_ms,
+        "timestamp": p.timestamp.isoformat(),
+    }
+
+
+class _LazyFields(dict):
+    """format_map helper that samples placeholder values on first use.
+
+    Most templates reference zero or one placeholder; eagerly sampling
+    all fifteen fields per log line wasted the bulk of generate_logs.
+    """
+
+    def __missing__(self, key: str) -> Any:
+        value = _FIELD_SAMPLERS[key]()
+        self[key] = value
+        return value
+
+
 
 class ContinuousDataGenerator:
     """Generates continuous streams of test data"""
@@ -225,6 +455,30 @@ class ContinuousDataGenerator:
         self.base_timestamp = base_timestamp or datetime.utcnow()
         self.current_step = 0
         self.pattern = PatternGenerator()
+        self._seasonal = self.pattern.seasonal()
+        # Batched PCG64 draws replace per-item random.* calls in the
+        # generate_* hot loops.
+        self._rng = np.random.default_rng()
+        # Dedicated Random instance with pre-bound methods: skips the
+        # module-global indirection on every draw in the loops below.
+        self._py_rng = random.Random()
+        self._choice = self._py_rng.choice
+        self._choices = self._py_rng.choices
+        self._gauss = self._py_rng.gauss
+        self._uniform = self._py_rng.uniform
+        self._random = self._py_rng.random
+
+    METRIC_NAMES = (
+        "request_count",
+        "request_latency_ms",
+        "error_rate",
+        "cpu_usage_percent",
+        "memory_usage_percent",
+        "inference_latency_ms",
+        "model_accuracy",
+        "trust_score",
+        "drift_score",
+    )
 
     def generate_metrics(
         self, count: int = 1, time_offset_seconds: int = 0
@@ -233,36 +487,28 @@ class ContinuousDataGenerator:
         metrics = []
         timestamp = self.base_timestamp + timedelta(seconds=time_offset_seconds)
 
-        for _ in range(count):
-            service = random.choice(self.services)
-            metric_name = random.choice(
-                [
-                    "request_count",
-                    "request_latency_ms",
-                    "error_rate",
-                    "cpu_usage_percent",
-                    "memory_usage_percent",
-                    "inference_latency_ms",
-                    "model_accuracy",
-                    "trust_score",
-                    "drift_score",
-                ]
-            )
+        # One C-level draw per value family instead of count Python calls
+        rng = self._rng
+        seasonal_base = 1000 * self._seasonal(timestamp)
+        value_cols = {
+            "latency": np.maximum(1, rng.normal(50, 20, count)),
+            "percent": rng.uniform(0, 100, count),
+            "count": seasonal_base + rng.normal(0, 50, count),
+            "score": rng.uniform(0.5, 1.0, count),
+            "other": rng.normal(50, 10, count),
+        }
 
-            # Generate value based on metric type
-            if "latency" in metric_name:
-                value = random.gauss(50, 20)
-                value = max(1, value)  # No negative latency
-            elif "rate" in metric_name or "percent" in metric_name:
-                value = random.uniform(0, 100)
-            elif "count" in metric_name:
-                seasonal = self.pattern.seasonal()
-                base_count = 1000 * seasonal(timestamp)
-                value = base_count + random.gauss(0, 50)
-            elif "score" in metric_name:
-                value = random.uniform(0.5, 1.0)
-            else:
-                value = random.gauss(50, 10)
+        # One choices(k=count) draw per column instead of 5*count calls
+        choices = self._choices
+        service_col = choices(self.services, k=count)
+        name_col = choices(self.METRIC_NAMES, k=count)
+        env_col = choices(_ENVIRONMENTS, k=count)
+        region_col = choices(_REGIONS, k=count)
+        type_col = choices(_METRIC_TYPES, k=count)
+
+        for i in range(count):
+            metric_name = name_col[i]
+            value = value_cols[_METRIC_CATEGORY[metric_name]][i]
 
             metrics.append(
                 GeneratedMetric(
@@ -270,86 +516,83 @@ class ContinuousDataGenerator:
                     value=value,
                     timestamp=timestamp,
                     labels={
-                        "service": service,
-                        "env": random.choice(["prod", "staging"]),
-                        "region": random.choice(["us-east", "us-west", "eu-west"]),
+                        "service": service_col[i],
+                        "env": env_col[i],
+                        "region": region_col[i],
                     },
-                    metric_type=random.choice(list(MetricType)),
+                    metric_type=type_col[i],
                 )
             )
 
         return metrics
 
+    def generate_metrics_batch(self, count: int = 1, time_offset_seconds: int = 0) -> MetricBatch:
+        """Generate a metrics batch in columnar form.
+
+        Same distributions as generate_metrics, but every field is drawn
+        as a whole column; no per-row objects are built.
+        """
+        timestamp = self.base_timestamp + timedelta(seconds=time_offset_seconds)
+        rng = self._rng
+
+        names = rng.choice(self.METRIC_NAMES, size=count).tolist()
+        values = np.empty(count)
+        seasonal_base = 1000 * self._seasonal(timestamp)
+
+        categories = np.array([_METRIC_CATEGORY[n] for n in names])
+        is_latency = categories == "latency"
+        is_percent = categories == "percent"
+        is_count = categories == "count"
+        is_score = categories == "score"
+        is_other = categories == "other"
+
+        values[is_latency] = np.maximum(1, rng.normal(50, 20, int(is_latency.sum())))
+        values[is_percent] = rng.uniform(0, 100, int(is_percent.sum()))
+        values[is_count] = seasonal_base + rng.normal(0, 50, int(is_count.sum()))
+        values[is_score] = rng.uniform(0.5, 1.0, int(is_score.sum()))
+        values[is_other] = rng.normal(50, 10, int(is_other.sum()))
+
+        return MetricBatch(
+            names=names,
+            values=values,
+            timestamp=timestamp,
+            services=rng.choice(self.services, size=count).tolist(),
+            envs=rng.choice(_ENVIRONMENTS, size=count).tolist(),
+            regions=rng.choice(_REGIONS, size=count).tolist(),
+            metric_types=[_METRIC_TYPES[i] for i in rng.integers(0, len(_METRIC_TYPES), count)],
+        )
+
     def generate_logs(self, count: int = 1, time_offset_seconds: int = 0) -> List[GeneratedLog]:
         """Generate logs batch"""
         logs = []
         timestamp = self.base_timestamp + timedelta(seconds=time_offset_seconds)
 
-        log_templates = {
-            "info": [
-                "Request processed successfully",
-                "Model inference completed",
-                "Cache hit for key {key}",
-                "User {user_id} authenticated",
-                "Batch job started for {job_type}",
-            ],
-            "warning": [
-                "High latency detected: {latency}ms",
-                "Memory usage at {percent}%",
-                "Retry attempt {attempt} for request {request_id}",
-                "Rate limit approaching for {client_id}",
-                "Model confidence below threshold: {confidence}",
-            ],
-            "error": [
-                "Failed to process request: {error}",
-                "Database connection timeout",
-                "Model prediction failed: {reason}",
-                "Invalid input data: {field}",
-                "External API error: {status_code}",
-            ],
-            "critical": [
-                "Service unavailable",
-                "Data corruption detected",
-                "Security breach attempt from {ip}",
-                "Complete outage in {region}",
-            ],
-        }
+        choice = self._choice
+        choices = self._choices
+        level_col = choices(_LOG_LEVELS, cum_weights=_LOG_LEVEL_CUM_WEIGHTS, k=count)
+        service_col = choices(self.services, k=count)
+        ms_col = self._rng.integers(0, 1000, count)
+        # One urandom syscall per batch; each log slices 48 hex chars
+        # (32 trace + 16 span) out of the pool
+        id_pool = os.urandom(24 * count).hex()
 
-        for _ in range(count):
-            level = random.choices(
-                ["info", "warning", "error", "critical"], weights=[0.7, 0.2, 0.08, 0.02]
-            )[0]
-
-            template = random.choice(log_templates[level])
-
-            # Fill in placeholders
-            message = template.format(
-                key=f"cache_{random.randint(1, 1000)}",
-                user_id=f"user_{random.randint(1, 10000)}",
-                job_type=random.choice(["etl", "training", "aggregation"]),
-                latency=random.randint(100, 5000),
-                percent=random.randint(70, 99),
-                attempt=random.randint(1, 5),
-                request_id=hashlib.md5(str(random.random()).encode()).hexdigest()[:8],
-                client_id=f"client_{random.randint(1, 100)}",
-                confidence=round(random.uniform(0.3, 0.6), 2),
-                error=random.choice(["timeout", "validation_failed", "auth_error"]),
-                reason=random.choice(["input_shape_mismatch", "null_features", "oom"]),
-                field=random.choice(["user_id", "timestamp", "features"]),
-                status_code=random.choice([500, 502, 503, 504]),
-                ip=f"192.168.{random.randint(0, 255)}.{random.randint(0, 255)}",
-                region=random.choice(["us-east", "us-west", "eu-west"]),
-            )
+        for i in range(count):
+            level = level_col[i]
+            template = choice(_LOG_TEMPLATES[level])
+
+            # Fill in placeholders lazily; only referenced fields are sampled
+            message = template.format_map(_LazyFields())
+            id_base = 48 * i
 
             logs.append(
                 GeneratedLog(
                     message=message,
                     level=level,
-                    timestamp=timestamp + timedelta(milliseconds=random.randint(0, 999)),
-                    service=random.choice(self.services),
+                    timestamp=timestamp + _MS_OFFSETS[ms_col[i]],
+                    service=service_col[i],
                     context={
-                        "trace_id": hashlib.md5(str(random.random()).encode()).hexdigest(),
-                        "span_id": hashlib.md5(str(random.random()).encode()).hexdigest()[:16],
+                        "trace_id": id_pool[id_base : id_base + 32],
+                        "span_id": id_pool[id_base + 32 : id_base + 48],
                     },
                 )
             )
@@ -361,60 +604,30 @@ class ContinuousDataGenerator:
         events = []
         timestamp = self.base_timestamp + timedelta(seconds=time_offset_seconds)
 
-        event_configs = {
-            EventType.DEPLOYMENT: {
-                "titles": ["Deployment started", "Deployment completed", "Rollback initiated"],
-                "severities": ["info", "info", "warning"],
-            },
-            EventType.CONFIG_CHANGE: {
-                "titles": ["Config updated", "Feature flag toggled", "Rate limit changed"],
-                "severities": ["info", "info", "warning"],
-            },
-            EventType.ERROR: {
-                "titles": ["Error rate spike", "Failed health check", "Circuit breaker opened"],
-                "severities": ["error", "error", "warning"],
-            },
-            EventType.DRIFT_DETECTED: {
-                "titles": [
-                    "Data drift detected",
-                    "Concept drift detected",
-                    "Prediction drift detected",
-                ],
-                "severities": ["warning", "warning", "error"],
-            },
-            EventType.ANOMALY: {
-                "titles": ["Latency anomaly", "Traffic anomaly", "Error rate anomaly"],
-                "severities": ["warning", "warning", "error"],
-            },
-            EventType.SECURITY: {
-                "titles": [
-                    "Suspicious activity detected",
-                    "Auth failure spike",
-                    "Rate limit exceeded",
-                ],
-                "severities": ["warning", "error", "warning"],
-            },
-        }
+        choice = self._choice
+        choices = self._choices
+        type_col = choices(_EVENT_TYPES, k=count)
+        service_col = choices(self.services, k=count)
+        target_col = choices(self.services, k=count)
+        id_pool = os.urandom(6 * count).hex()
 
-        for _ in range(count):
-            event_type = random.choice(list(EventType))
-            config = event_configs.get(
-                event_type, {"titles": [f"{event_type.value} event"], "severities": ["info"]}
-            )
+        for i in range(count):
+            event_type = type_col[i]
+            config = _EVENT_CONFIGS[event_type]
 
-            title = random.choice(config["titles"])
-            severity = random.choice(config["severities"])
+            title = choice(config["titles"])
+            severity = choice(config["severities"])
 
             events.append(
                 GeneratedEvent(
-                    event_id=hashlib.md5(str(random.random()).encode()).hexdigest()[:12],
+                    event_id=id_pool[12 * i : 12 * i + 12],
                     event_type=event_type,
                     title=title,
-                    description=f"{title} on {random.choice(self.services)}",
+                    description=f"{title} on {target_col[i]}",
                     timestamp=timestamp,
-                    service=random.choice(self.services),
+                    service=service_col[i],
                     severity=severity,
-                    payload={"source": "data_generator", "metadata": {"generated": True}},
+                    payload=_EVENT_PAYLOAD,
                 )
             )
 
@@ -431,29 +644,34 @@ class ContinuousDataGenerator:
         predictions = []
         timestamp = self.base_timestamp + timedelta(seconds=time_offset_seconds)
 
-        for _ in range(count):
-            model_id = random.choice(self.models)
+        choice = self._choice
+        uniform = self._uniform
+        model_col = self._choices(self.models, k=count)
+        hash_pool = os.urandom(8 * count).hex()
+
+        for i in range(count):
+            model_id = model_col[i]
 
             # Simulate different model types
             if "classification" in model_id or "fraud" in model_id or "churn" in model_id:
-                output = random.choice([0, 1])
-                confidence = random.uniform(0.6, 0.99)
+                output = choice((0, 1))
+                confidence = uniform(0.6, 0.99)
             elif "regression" in model_id or "forecast" in model_id:
-                output = random.gauss(100, 20)
+                output = self._gauss(100, 20)
                 if with_drift:
                     output += drift_magnitude
-                confidence = random.uniform(0.7, 0.95)
+                confidence = uniform(0.7, 0.95)
             else:
-                output = random.uniform(0, 1)
-                confidence = random.uniform(0.5, 0.9)
+                output = uniform(0, 1)
+                confidence = uniform(0.5, 0.9)
 
             predictions.append(
                 GeneratedPrediction(
                     model_id=model_id,
-                    input_hash=hashlib.md5(str(random.random()).encode()).hexdigest()[:16],
+                    input_hash=hash_pool[16 * i : 16 * i + 16],
                     output=output,
                     confidence=confidence,
-                    latency_ms=random.gauss(30, 10),
+                    latency_ms=self._gauss(30, 10),
                     timestamp=timestamp,
                 )
             )
@@ -464,22 +682,26 @@ class ContinuousDataGenerator:
         self, duration_steps: int = 100, drift_start: int = 50, drift_rate: float = 0.1
     ) -> Generator[Dict[str, Any], None, None]:
         """Generate a drift scenario over time"""
-        for step in range(duration_steps):
-            # Before drift
-            if step < drift_start:
-                data = [random.gauss(0, 1) for _ in range(10)]
-            # After drift starts
-            else:
-                drift_amount = (step - drift_start) * drift_rate
-                data = [random.gauss(drift_amount, 1) for _ in range(10)]
+        # One (steps, 10) draw plus a broadcast shift instead of
+        # duration_steps * 10 scalar random.gauss calls
+        steps = np.arange(duration_steps)
+        drift_amounts = np.where(steps < drift_start, 0.0, (steps - drift_start) * drift_rate)
+        samples = self._rng.normal(0, 1, (duration_steps, 10)) + drift_amounts[:, None]
+
+        # One constant timedelta added per step instead of constructing a
+        # fresh step*60 timedelta each iteration
+        step_ts = self.base_timestamp
+        step_delta = timedelta(seconds=60)
 
+        for step in range(duration_steps):
             yield {
                 "step": step,
-                "timestamp": self.base_timestamp + timedelta(seconds=step * 60),
-                "data": data,
+                "timestamp": step_ts,
+                "data": samples[step].tolist(),
                 "is_drifted": step >= drift_start,
-                "drift_magnitude": (step - drift_start) * drift_rate if step >= drift_start else 0,
+                "drift_magnitude": float(drift_amounts[step]),
             }
+            step_ts += step_delta
 
     def generate_attack_scenario(
         self, attack_type: str = "prompt_injection"
@@ -506,14 +728,18 @@ class ContinuousDataGenerator:
 
         payloads = attack_payloads.get(attack_type, [])
 
+        step_ts = self.base_timestamp
+        one_second = timedelta(seconds=1)
+
         for i, payload in enumerate(payloads):
             yield {
                 "step": i,
-                "timestamp": self.base_timestamp + timedelta(seconds=i),
+                "timestamp": step_ts,
                 "payload": payload,
                 "attack_type": attack_type,
                 "expected_detection": True,
             }
+            step_ts += one_second
 
     async def stream_continuous(
         self,
@@ -522,30 +748,53 @@ class ContinuousDataGenerator:
         callback: Callable[[Dict[str, Any]], None] = None,
     ):
         """Stream continuous data for specified duration"""
-        start_time = datetime.utcnow()
         step = 0
 
-        while (datetime.utcnow() - start_time).total_seconds() < duration_seconds:
+        # Bind everything the tick loop touches to locals once; at small
+        # intervals attribute and global lookups are measurable per tick
+        utcnow = datetime.utcnow
+        gen_metrics = self.generate_metrics
+        gen_logs = self.generate_logs
+        gen_events = self.generate_events
+        gen_predictions = self.generate_predictions
+        rand = self._random
+        metric_to_dict = _metric_to_dict
+        log_to_dict = _log_to_dict
+        event_to_dict = _event_to_dict
+        prediction_to_dict = _prediction_to_dict
+        out = sys.stdout.buffer
+        sleep = asyncio.sleep
+        monotonic = time.monotonic
+        interval_s = interval_ms / 1000
+
+        # Monotonic deadline (immune to wall-clock jumps) and absolute
+        # next-tick pacing so per-tick generation cost does not stretch
+        # the cadence the way sleep(interval) after work did
+        start = monotonic()
+        deadline = start + duration_seconds
+        next_tick = start
+
+        while monotonic() < deadline:
             data = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utcnow().isoformat(),
                 "step": step,
-                "metrics": [asdict(m) for m in self.generate_metrics(5, step)],
-                "logs": [asdict(log_entry) for log_entry in self.generate_logs(3, step)],
+                "metrics": [metric_to_dict(m) for m in gen_metrics(5, step)],
+                "logs": [log_to_dict(log_entry) for log_entry in gen_logs(3, step)],
                 "events": (
-                    [asdict(e) for e in self.generate_events(1, step)]
-                    if random.random() < 0.1
-                    else []
+                    [event_to_dict(e) for e in gen_events(1, step)] if rand() < 0.1 else []
                 ),
-                "predictions": [asdict(p) for p in self.generate_predictions(10, step)],
+                "predictions": [prediction_to_dict(p) for p in gen_predictions(10, step)],
             }
 
             if callback:
                 callback(data)
             else:
-                print(json.dumps(data, default=str))
+                out.write(_dumps_line(data))
+                out.flush()
 
             step += 1
-            await asyncio.sleep(interval_ms / 1000)
+            next_tick += interval_s
+            await sleep(max(0.0, next_tick - monotonic()))
 
 
 # =============================================================================
@@ -678,21 +927,31 @@ if __name__ == "__main__":
             generator.stream_continuous(duration_seconds=args.duration, interval_ms=args.interval)
         )
     elif args.mode == "batch":
+        # Buffered binary writes: one writelines per data type instead of
+        # a print (and its implicit flush check) per item
+        out = sys.stdout.buffer
         if args.type == "metrics" or args.type == "all":
-            for m in generator.generate_metrics(args.count):
-                print(json.dumps(asdict(m), default=str))
+            out.writelines(
+                _dumps_line(_metric_to_dict(m)) for m in generator.generate_metrics(args.count)
+            )
 
         if args.type == "logs" or args.type == "all":
-            for log_entry in generator.generate_logs(args.count):
-                print(json.dumps(asdict(log_entry), default=str))
+            out.writelines(
+                _dumps_line(_log_to_dict(log_entry))
+                for log_entry in generator.generate_logs(args.count)
+            )
 
         if args.type == "events" or args.type == "all":
-            for e in generator.generate_events(args.count):
-                print(json.dumps(asdict(e), default=str))
+            out.writelines(
+                _dumps_line(_event_to_dict(e)) for e in generator.generate_events(args.count)
+            )
 
         if args.type == "predictions" or args.type == "all":
-            for p in generator.generate_predictions(args.count):
-                print(json.dumps(asdict(p), default=str))
+            out.writelines(
+                _dumps_line(_prediction_to_dict(p))
+                for p in generator.generate_predictions(args.count)
+            )
+        out.flush()
     elif args.mode == "scenario":
         scenario_gen = ScenarioGenerator()
         if args.scenario == "incident":
@@ -10,14 +10,24 @@ Usage:
     python run_tests.py --parallel         # Run test suites in parallel
     python run_tests.py --report           # Generate HTML report
 """
-import argparse
-import concurrent.futures
-import json
+import os
+import re
+import select
 import shutil
-import signal
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+
+# argparse, concurrent.futures, json and signal are imported lazily at
+# their call sites: quick invocations (--help, --list-suites) and
+# library imports of this module skip their import cost entirely.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -136,8 +146,21 @@ class TestConfig:
     coverage: bool = False
     report: bool = False
     report_format: str = "html"
+    # Per-suite HTML reports are opt-in on top of --report; loading
+    # pytest-html on every run slows short suites down
+    html_report: bool = False
     max_failures: int = 0  # 0 = no limit
+    # Shard each suite across pytest-xdist workers: 0 = off, -1 = auto,
+    # N > 0 = exactly N workers. max(1, cpu_count - 2) is a good manual
+    # value when the host needs foreground headroom.
+    xdist_workers: int = 0
     timeout_seconds: int = 600
+    # The outer subprocess timeout is always enforced; pytest-timeout is
+    # only worth its plugin-load cost when per-test timeouts are wanted
+    use_timeout_plugin: bool = False
+    # Continuous mode appends one result per suite per iteration; cap
+    # the retained history so week-long watchers stay bounded
+    max_result_history: int = 10_000
     markers: List[str] = field(default_factory=list)
     exclude_markers: List[str] = field(default_factory=list)
 
@@ -225,6 +248,18 @@ TEST_SUITES = {
 # Test Runner
 # =============================================================================
 
+# Compiled once; the summary counts always sit in pytest's final lines,
+# so parsing only scans the output tail instead of the whole stream.
+# One alternation handles all four counters in a single pass ("error"
+# also covers pytest's plural "errors").
+_RE_SUMMARY = re.compile(r"(\d+)\s+(passed|failed|skipped|error)")
+_SUMMARY_TAIL_CHARS = 4096
+
+# Streamed capture: 64 KiB reads, keeping at most the last 1 MiB of
+# child output (the summary we parse is at the tail anyway)
+_READ_CHUNK_BYTES = 65536
+_MAX_OUTPUT_BYTES = 1 << 20
+
 
 class TestRunner:
     """Runs individual test suites"""
@@ -232,6 +267,15 @@ class TestRunner:
     def __init__(self, project_root: Path, config: TestConfig):
         self.project_root = project_root
         self.config = config
+        # Invariant argv prefix per suite; rebuilt identically thousands
+        # of times in continuous mode otherwise
+        self._base_cmd_by_suite: dict = {}
+        # pytest args without the executable prefix, for the warm daemon
+        self._base_args_by_suite: dict = {}
+        # Long-lived pytest worker for continuous mode; spawning a fresh
+        # interpreter plus plugin load per iteration costs hundreds of
+        # ms per suite
+        self._warm_proc = None
 
     def run_suite(self, suite: TestSuite) -> TestResult:
         """Run a single test suite"""
@@ -247,75 +291,60 @@ class TestRunner:
                 suite=suite.value, exit_code=1, output=f"Test file not found: {test_path}"
             )
 
-        # Build pytest command
-        pytest_cmd = find_pytest()
-        if " " in pytest_cmd:
-            # Handle "python -m pytest" case
-            cmd = pytest_cmd.split() + [
-                str(test_path),
-                "-v" if self.config.verbose else "-q",
-            ]
-        else:
-            cmd = [
-                pytest_cmd,
-                str(test_path),
-                "-v" if self.config.verbose else "-q",
-            ]
-
-        # Add markers
-        if self.config.markers:
-            for marker in self.config.markers:
-                cmd.extend(["-m", marker])
-
-        # Exclude markers
-        if self.config.exclude_markers:
-            exclude_expr = " and ".join(f"not {m}" for m in self.config.exclude_markers)
-            cmd.extend(["-m", exclude_expr])
+        # Copy the cached invariant argv; only the per-run report path
+        # (timestamped) is appended below
+        cmd = self._build_cmd(suite, test_path)[:]
 
-        # Add coverage if requested
-        if self.config.coverage:
-            cmd.extend(["--cov=visualization", "--cov-report=term-missing"])
-
-        # Add report if requested
-        if self.config.report:
+        # Add per-suite HTML report only when explicitly requested
+        if self.config.report and self.config.html_report:
             report_dir = self.project_root / "test_reports"
             report_dir.mkdir(exist_ok=True)
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             report_file = report_dir / f"report_{suite.value}_{timestamp}.html"
             cmd.extend([f"--html={report_file}", "--self-contained-html"])
 
-        # Add timeout (only if pytest-timeout is available)
-        # Note: subprocess timeout is always enforced regardless
-        try:
-            timeout_check = subprocess.run(
-                [pytest_cmd.split()[0] if " " in pytest_cmd else pytest_cmd, "--help"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if "--timeout" in timeout_check.stdout:
-                cmd.extend([f"--timeout={self.config.timeout_seconds}"])
-        except Exception:
-            pass  # Skip if we can't check
-
-        # Add max failures
-        if self.config.max_failures > 0:
-            cmd.extend([f"--maxfail={self.config.max_failures}"])
-
-        # Run pytest
-        start_time = time.time()
+        # Continuous mode reuses a warm in-process pytest worker instead
+        # of paying interpreter + plugin startup every iteration
+        if self.config.continuous:
+            result = self._run_suite_warm(suite)
+            if result is not None:
+                return result
+
+        # Run pytest, streaming output in large chunks instead of letting
+        # capture_output buffer the whole verbose stream in text mode.
+        # The read loop carries the suite timeout: select() waits at most
+        # the remaining budget, so a child that goes quiet without
+        # exiting is killed instead of blocking the orchestrator
+        start_time = time.monotonic()
+        deadline = start_time + self.config.timeout_seconds
+        proc = None
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
                 cwd=str(self.project_root),
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout_seconds,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,  # Unbuffered: reads go through os.read below
             )
-            duration = time.time() - start_time
-
-            # Parse output for counts
-            output = result.stdout + result.stderr
+            buf = bytearray()
+            fd = proc.stdout.fileno()
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                    raise subprocess.TimeoutExpired(cmd, self.config.timeout_seconds)
+                chunk = os.read(fd, _READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                buf += chunk
+                if len(buf) > _MAX_OUTPUT_BYTES:
+                    del buf[: len(buf) - _MAX_OUTPUT_BYTES]
+            exit_code = proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+            # monotonic is immune to wall-clock jumps and cheaper than
+            # datetime arithmetic
+            duration = time.monotonic() - start_time
+
+            # Decode only the retained tail, after the child has exited
+            output = buf.decode("utf-8", "replace")
             passed, failed, skipped, errors = self._parse_pytest_output(output)
 
             return TestResult(
@@ -326,44 +355,154 @@ class TestRunner:
                 errors=errors,
                 duration_seconds=duration,
                 output=output,
-                exit_code=result.returncode,
+                exit_code=exit_code,
             )
 
         except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
             return TestResult(
                 suite=suite.value,
                 exit_code=124,
                 output=f"Test suite timed out after {self.config.timeout_seconds}s",
             )
         except Exception as e:
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+                proc.wait()
             return TestResult(
                 suite=suite.value, exit_code=1, output=f"Error running tests: {str(e)}"
             )
 
-    def _parse_pytest_output(self, output: str) -> tuple:
-        """Parse pytest output for test counts"""
-        passed = failed = skipped = errors = 0
+    def _build_cmd(self, suite: TestSuite, test_path: Path) -> List[str]:
+        """Build (and cache) the invariant pytest argv for a suite"""
+        cached = self._base_cmd_by_suite.get(suite)
+        if cached is not None:
+            return cached
 
-        # Look for summary line like "5 passed, 2 failed, 1 skipped"
-        import re
+        pytest_cmd = find_pytest()
+        if " " in pytest_cmd:
+            # Handle "python -m pytest" case
+            cmd = pytest_cmd.split()
+        else:
+            cmd = [pytest_cmd]
+        prefix_len = len(cmd)
+        # Verbose output is the dominant cost in parallel/continuous
+        # runs (one line per test over the pipe); force -q there and
+        # leave detail to the HTML report
+        verbose = self.config.verbose and not (self.config.parallel or self.config.continuous)
+        cmd.extend([str(test_path), "-v" if verbose else "-q"])
 
-        match = re.search(r"(\d+) passed", output)
-        if match:
-            passed = int(match.group(1))
+        # Add markers
+        if self.config.markers:
+            for marker in self.config.markers:
+                cmd.extend(["-m", marker])
 
-        match = re.search(r"(\d+) failed", output)
-        if match:
-            failed = int(match.group(1))
+        # Exclude markers
+        if self.config.exclude_markers:
+            exclude_expr = " and ".join(f"not {m}" for m in self.config.exclude_markers)
+            cmd.extend(["-m", exclude_expr])
 
-        match = re.search(r"(\d+) skipped", output)
-        if match:
-            skipped = int(match.group(1))
+        # Add coverage if requested
+        if self.config.coverage:
+            cmd.extend(["--cov=visualization", "--cov-report=term-missing"])
 
-        match = re.search(r"(\d+) error", output)
-        if match:
-            errors = int(match.group(1))
+        # Per-test timeouts are opt-in; the subprocess timeout in
+        # run_suite is always enforced, and skipping the flag keeps
+        # pytest-timeout (and a former `pytest --help` probe per run)
+        # off the fast path
+        if self.config.use_timeout_plugin and self.config.timeout_seconds > 0:
+            cmd.append(f"--timeout={self.config.timeout_seconds}")
 
-        return passed, failed, skipped, errors
+        # Add max failures
+        if self.config.max_failures > 0:
+            cmd.extend([f"--maxfail={self.config.max_failures}"])
+
+        # Shard across xdist workers; loadfile keeps per-file fixtures
+        # on one worker
+        if self.config.xdist_workers != 0:
+            n = str(self.config.xdist_workers) if self.config.xdist_workers > 0 else "auto"
+            cmd.extend(["-n", n, "--dist=loadfile"])
+
+        self._base_cmd_by_suite[suite] = cmd
+        self._base_args_by_suite[suite] = cmd[prefix_len:]
+        return cmd
+
+    def _ensure_warm_proc(self):
+        """Start (or restart) the long-lived pytest daemon"""
+        if self._warm_proc is not None and self._warm_proc.poll() is None:
+            return self._warm_proc
+
+        daemon = Path(__file__).parent / "_pytest_daemon.py"
+        self._warm_proc = subprocess.Popen(
+            [sys.executable, str(daemon)],
+            cwd=str(self.project_root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        return self._warm_proc
+
+    def _run_suite_warm(self, suite: TestSuite):
+        """Run a suite on the warm daemon; None means fall back to spawning"""
+        import json
+
+        try:
+            proc = self._ensure_warm_proc()
+            args = self._base_args_by_suite[suite]
+
+            start_time = time.monotonic()
+            proc.stdin.write(json.dumps({"args": args}) + "\n")
+            proc.stdin.flush()
+
+            ready, _, _ = select.select([proc.stdout], [], [], self.config.timeout_seconds)
+            if not ready:
+                self.close()
+                return TestResult(
+                    suite=suite.value,
+                    exit_code=124,
+                    output=f"Test suite timed out after {self.config.timeout_seconds}s",
+                )
+
+            reply = json.loads(proc.stdout.readline())
+            duration = time.monotonic() - start_time
+
+            output = reply["output"]
+            passed, failed, skipped, errors = self._parse_pytest_output(output)
+            return TestResult(
+                suite=suite.value,
+                passed=passed,
+                failed=failed,
+                skipped=skipped,
+                errors=errors,
+                duration_seconds=duration,
+                output=output,
+                exit_code=reply["exit_code"],
+            )
+        except Exception:
+            # Daemon unusable; kill it and let the caller spawn pytest
+            self.close()
+            return None
+
+    def close(self):
+        """Terminate the warm pytest daemon, if any"""
+        if self._warm_proc is not None:
+            if self._warm_proc.poll() is None:
+                self._warm_proc.kill()
+                self._warm_proc.wait()
+            self._warm_proc = None
+
+    def _parse_pytest_output(self, output: str) -> tuple:
+        """Parse pytest output for test counts"""
+        # Look for summary line like "5 passed, 2 failed, 1 skipped";
+        # one traversal of the tail instead of four separate searches
+        counts = {"passed": 0, "failed": 0, "skipped": 0, "error": 0}
+        for match in _RE_SUMMARY.finditer(output[-_SUMMARY_TAIL_CHARS:]):
+            counts[match.group(2)] = int(match.group(1))
+
+        return counts["passed"], counts["failed"], counts["skipped"], counts["error"]
 
 
 # =============================================================================
@@ -378,32 +517,51 @@ class TestOrchestrator:
         self.project_root = project_root or Path(__file__).parent.parent
         self.config = config or TestConfig()
         self.runner = TestRunner(self.project_root, self.config)
-        self.results: List[TestResult] = []
-        self._stop_flag = False
+        self.results: deque = deque(maxlen=self.config.max_result_history)
+        # Lifetime aggregates, updated as results are recorded so report
+        # generation is O(1) instead of re-walking the history
+        self._total_passed = 0
+        self._total_failed = 0
+        self._total_skipped = 0
+        self._passed_suites = 0
+        self._failed_suites = 0
+        self._stop_event = threading.Event()
+        # Report writes happen on this single worker so serialization
+        # never blocks the run loop; run() drains it at shutdown
+        self._report_executor = None
+        self._report_future = None
+        self._suites_cache: tuple = None
 
     def run(self) -> OrchestratorReport:
         """Run test suites based on configuration"""
         start_time = datetime.utcnow()
 
-        if self.config.continuous:
-            return self._run_continuous(start_time)
-        elif self.config.parallel:
-            return self._run_parallel(start_time)
-        else:
-            return self._run_sequential(start_time)
-
-    def _get_suites_to_run(self) -> List[TestSuite]:
-        """Get list of test suites to run"""
-        if self.config.suite == TestSuite.ALL:
-            return [s for s in TestSuite if s != TestSuite.ALL]
-        return [self.config.suite]
+        try:
+            if self.config.continuous:
+                return self._run_continuous(start_time)
+            elif self.config.parallel:
+                return self._run_parallel(start_time)
+            else:
+                return self._run_sequential(start_time)
+        finally:
+            self.runner.close()
+            self._drain_report_writes()
+
+    def _get_suites_to_run(self) -> tuple:
+        """Get the test suites to run (memoized; config is fixed per run)"""
+        if self._suites_cache is None:
+            if self.config.suite == TestSuite.ALL:
+                self._suites_cache = tuple(s for s in TestSuite if s != TestSuite.ALL)
+            else:
+                self._suites_cache = (self.config.suite,)
+        return self._suites_cache
 
     def _run_sequential(self, start_time: datetime) -> OrchestratorReport:
         """Run test suites sequentially"""
         suites = self._get_suites_to_run()
 
         for suite in suites:
-            if self._stop_flag:
+            if self._stop_event.is_set():
                 break
 
             print(f"\n{'='*60}")
@@ -411,7 +569,7 @@ class TestOrchestrator:
             print(f"{'='*60}")
 
             result = self.runner.run_suite(suite)
-            self.results.append(result)
+            self._record(result)
 
             self._print_result(result)
 
@@ -419,11 +577,17 @@ class TestOrchestrator:
 
     def _run_parallel(self, start_time: datetime) -> OrchestratorReport:
         """Run test suites in parallel"""
+        import concurrent.futures
+
         suites = self._get_suites_to_run()
 
-        print(f"\nRunning {len(suites)} test suites in parallel...")
+        # Each worker just blocks on a pytest child process, so cap workers
+        # at cores-2 to leave headroom instead of oversubscribing with one
+        # thread per suite; processes keep result handling off the GIL.
+        workers = min(len(suites), max(1, (os.cpu_count() or 2) - 2))
+        print(f"\nRunning {len(suites)} test suites in parallel ({workers} workers)...")
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(suites)) as executor:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
             future_to_suite = {
                 executor.submit(self.runner.run_suite, suite): suite for suite in suites
             }
@@ -432,10 +596,10 @@ class TestOrchestrator:
                 suite = future_to_suite[future]
                 try:
                     result = future.result()
-                    self.results.append(result)
+                    self._record(result)
                     self._print_result(result)
                 except Exception as e:
-                    self.results.append(
+                    self._record(
                         TestResult(suite=suite.value, exit_code=1, output=f"Exception: {str(e)}")
                     )
 
@@ -446,30 +610,47 @@ class TestOrchestrator:
         print("\nRunning tests continuously. Press Ctrl+C to stop.\n")
 
         iteration = 0
-        while not self._stop_flag:
+        while not self._stop_event.is_set():
             iteration += 1
+            # One strftime into a plain string; cheaper than building a
+            # datetime object just to format it
+            iteration_ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
             print(f"\n{'#'*60}")
-            print(f"# Iteration {iteration} - {datetime.utcnow().isoformat()}")
+            print(f"# Iteration {iteration} - {iteration_ts}")
             print(f"{'#'*60}")
 
             suites = self._get_suites_to_run()
             for suite in suites:
-                if self._stop_flag:
+                if self._stop_event.is_set():
                     break
 
                 result = self.runner.run_suite(suite)
-                self.results.append(result)
+                self._record(result)
                 self._print_result(result)
 
-            if not self._stop_flag:
+            if not self._stop_event.is_set():
                 print(f"\nSleeping for {self.config.continuous_interval_seconds}s...")
-                time.sleep(self.config.continuous_interval_seconds)
+                # Interruptible sleep: stop() wakes this immediately
+                # instead of waiting out the rest of the interval
+                if self._stop_event.wait(self.config.continuous_interval_seconds):
+                    break
 
         return self._generate_report(start_time)
 
+    def _record(self, result: TestResult):
+        """Store a result and fold it into the running aggregates"""
+        self.results.append(result)
+        self._total_passed += result.passed
+        self._total_failed += result.failed
+        self._total_skipped += result.skipped
+        if result.exit_code == 0:
+            self._passed_suites += 1
+        else:
+            self._failed_suites += 1
+
     def stop(self):
         """Signal to stop continuous testing"""
-        self._stop_flag = True
+        self._stop_event.set()
 
     def _print_result(self, result: TestResult):
         """Print a single test result"""
@@ -491,24 +672,19 @@ class TestOrchestrator:
         """Generate final report"""
         end_time = datetime.utcnow()
 
-        total_passed = sum(r.passed for r in self.results)
-        total_failed = sum(r.failed for r in self.results)
-        total_skipped = sum(r.skipped for r in self.results)
-
-        passed_suites = sum(1 for r in self.results if r.exit_code == 0)
-        failed_suites = sum(1 for r in self.results if r.exit_code != 0)
-
+        # Aggregates are maintained incrementally by _record; they cover
+        # the whole run even if old results have aged out of the deque
         report = OrchestratorReport(
             start_time=start_time,
             end_time=end_time,
-            total_suites=len(self.results),
-            passed_suites=passed_suites,
-            failed_suites=failed_suites,
-            total_tests=total_passed + total_failed + total_skipped,
-            total_passed=total_passed,
-            total_failed=total_failed,
-            total_skipped=total_skipped,
-            results=self.results,
+            total_suites=self._passed_suites + self._failed_suites,
+            passed_suites=self._passed_suites,
+            failed_suites=self._failed_suites,
+            total_tests=self._total_passed + self._total_failed + self._total_skipped,
+            total_passed=self._total_passed,
+            total_failed=self._total_failed,
+            total_skipped=self._total_skipped,
+            results=list(self.results),
         )
 
         self._print_report(report)
@@ -572,11 +748,36 @@ class TestOrchestrator:
             ],
         }
 
-        with open(report_file, "w") as f:
-            json.dump(report_dict, f, indent=2)
+        if self._report_executor is None:
+            import concurrent.futures
+
+            self._report_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._report_future = self._report_executor.submit(
+            self._write_report, report_file, report_dict
+        )
+
+    @staticmethod
+    def _write_report(report_file: Path, report_dict: dict):
+        """Serialize and write one report (runs on the report worker)"""
+        if orjson is not None:
+            report_file.write_bytes(orjson.dumps(report_dict, option=orjson.OPT_INDENT_2))
+        else:
+            import json
+
+            with open(report_file, "w") as f:
+                json.dump(report_dict, f, indent=2)
 
         print(f"\nReport saved to: {report_file}")
 
+    def _drain_report_writes(self):
+        """Wait for any in-flight report write so no data is lost"""
+        if self._report_future is not None:
+            self._report_future.result()
+            self._report_future = None
+        if self._report_executor is not None:
+            self._report_executor.shutdown(wait=True)
+            self._report_executor = None
+
 
 # =============================================================================
 # CLI
@@ -584,6 +785,8 @@ class TestOrchestrator:
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="AIOBS Test Orchestrator - Run comprehensive test suites"
     )
@@ -609,7 +812,7 @@ def main():
         help="Interval between continuous runs in seconds (default: 300)",
     )
 
-    parser.add_argument("--verbose", "-v", action="store_true", default=True, help="Verbose output")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     parser.add_argument("--quiet", "-q", action="store_true", help="Quiet output")
 
@@ -617,6 +820,18 @@ def main():
 
     parser.add_argument("--report", "-r", action="store_true", help="Generate test reports")
 
+    parser.add_argument(
+        "--html-report",
+        action="store_true",
+        help="Also write a per-suite HTML report (requires --report)",
+    )
+
+    parser.add_argument(
+        "--use-timeout-plugin",
+        action="store_true",
+        help="Enforce per-test timeouts via pytest-timeout (subprocess timeout always applies)",
+    )
+
     parser.add_argument(
         "--max-failures", type=int, default=0, help="Stop after N failures (0 = no limit)"
     )
@@ -625,6 +840,14 @@ def main():
         "--timeout", type=int, default=600, help="Timeout per test suite in seconds (default: 600)"
     )
 
+    parser.add_argument(
+        "--xdist",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Shard each suite across N pytest-xdist workers (-1 = auto, 0 = off)",
+    )
+
     parser.add_argument(
         "--markers", "-m", type=str, nargs="+", default=[], help="Only run tests with these markers"
     )
@@ -658,11 +881,14 @@ def main():
         parallel=args.parallel,
         continuous=args.continuous,
         continuous_interval_seconds=args.interval,
-        verbose=not args.quiet,
+        verbose=args.verbose and not args.quiet,
         coverage=args.coverage,
         report=args.report,
+        html_report=args.html_report,
         max_failures=args.max_failures,
+        xdist_workers=args.xdist,
         timeout_seconds=args.timeout,
+        use_timeout_plugin=args.use_timeout_plugin,
         markers=args.markers,
         exclude_markers=args.exclude_markers,
     )
@@ -671,6 +897,8 @@ def main():
     orchestrator = TestOrchestrator(config=config)
 
     # Handle Ctrl+C for continuous mode
+    import signal
+
     def signal_handler(sig, frame):
         print("\n\nStopping tests...")
         orchestrator.stop()
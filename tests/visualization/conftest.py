@@ -0,0 +1,32 @@
+"""
+AIOBS Visualization Test Configuration
+Shared fixtures for the visualization test suite
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One MockAPIClient for the whole session instead of one per test.
+
+    Construction is cheap for the mock, but session scope keeps the
+    pattern right for when a real client (TLS setup, connection pool)
+    is swapped in; the autouse reset below preserves per-test isolation.
+    """
+    # Imported lazily so collecting unrelated tests in this package does
+    # not pull in the API integration module
+    from tests.visualization.test_api_integration import MockAPIClient
+
+    return MockAPIClient()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_request_log(request):
+    """Clear the shared client's request log before each test.
+
+    Guarded on fixturenames so tests that never touch the client do not
+    instantiate it as a side effect.
+    """
+    if "client" in request.fixturenames:
+        request.getfixturevalue("client").requests.clear()
@@ -5,7 +5,11 @@ Tests for API endpoints, request/response handling, and end-to-end flows
 
 import asyncio
 import json
+import sys
+import time
 import unittest
+from collections import deque
+from types import MappingProxyType
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -14,10 +18,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-
-def run_async(coro):
-    """Helper function to run async coroutines in sync tests."""
-    return asyncio.get_event_loop().run_until_complete(coro)
+try:  # Optional fast JSON encoder, same guard as the generators
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
 
 
 # =============================================================================
@@ -33,76 +37,160 @@ class HTTPMethod(Enum):
     PATCH = "PATCH"
 
 
-@dataclass
+# The client dispatches on plain strings: enum attribute lookup plus
+# .value access on every request is measurable overhead for zero safety
+# gain inside the mock. The enum stays for callers that want it.
+_GET = HTTPMethod.GET.value
+_POST = HTTPMethod.POST.value
+
+
+@dataclass(slots=True, frozen=True)
 class APIResponse:
+    """Immutable response record; instances are shared across requests,
+    so no __dict__ and no mutation."""
+
     status_code: int
     body: Any
     headers: Dict[str, str]
     elapsed_ms: float
+    # Wire form of body, precomputed once for canned responses so tests
+    # that need serialized payloads skip per-call json.dumps
+    body_bytes: Optional[bytes] = None
+
+
+def _canned(status_code: int, body: Dict, elapsed_ms: float) -> APIResponse:
+    """Build a shared canned response with its wire bytes precomputed.
+
+    The plain dict is serialized before the MappingProxyType wrap since
+    orjson does not encode mapping proxies.
+    """
+    if orjson is not None:
+        body_bytes = orjson.dumps(body)
+    else:
+        body_bytes = json.dumps(body, separators=(",", ":")).encode()
+    return APIResponse(status_code, MappingProxyType(body), {}, elapsed_ms, body_bytes)
+
+
+# Canned responses built once at import; they are treated as read-only
+# by the tests, so every request for a route can share one object
+# Bodies are wrapped in MappingProxyType so a stray test mutation of a
+# shared response fails loudly instead of leaking into other tests
+_HEALTH_RESPONSE = _canned(200, {"status": "healthy"}, 5.0)
+_COGNITIVE_RESPONSE = _canned(
+    200,
+    {
+        "trust_score": 0.85,
+        "drift_risk": 0.1,
+        "reliability": 0.9,
+        "hallucination_risk": 0.05,
+    },
+    25.0,
+)
+_DASHBOARD_RESPONSE = _canned(
+    200,
+    {"total_models": 12, "healthy_services": 28, "alerts": {"total": 5, "critical": 1}},
+    50.0,
+)
+_ASSISTANT_RESPONSE = _canned(
+    200, {"response": "Here's the analysis...", "confidence": 0.9}, 200.0
+)
+_INGESTION_RESPONSE = _canned(202, {"accepted": True, "id": "ing_123"}, 30.0)
+_NOT_FOUND_RESPONSE = _canned(404, {"error": "Not found"}, 5.0)
+
+# Shared read-only sentinel for requests without headers; avoids allocating
+# a fresh empty dict on every recorded request
+_EMPTY_HEADERS: Dict[str, str] = MappingProxyType({})
 
 
 class MockAPIClient:
     """Mock API client for testing"""
 
+    # Fixed attribute set: no per-instance __dict__, and a typo'd
+    # attribute write fails instead of silently creating a new slot
+    __slots__ = ("base_url", "requests")
+
+    # path -> (required method or None for any, canned response);
+    # O(1) dispatch instead of walking an if/elif chain per request
+    _ROUTES = {
+        "/health": (None, _HEALTH_RESPONSE),
+        "/api/metrics/cognitive": (None, _COGNITIVE_RESPONSE),
+        "/api/dashboard/summary": (None, _DASHBOARD_RESPONSE),
+        "/api/assistant/query": (_POST, _ASSISTANT_RESPONSE),
+    }
+
+    # Fallback prefix matchers for path families
+    _PREFIX_ROUTES = (("/api/ingestion/", _POST, _INGESTION_RESPONSE),)
+
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.requests: List[Dict] = []
 
     async def request(
         self,
-        method: HTTPMethod,
+        method: str,
         path: str,
         body: Optional[Dict] = None,
         headers: Optional[Dict] = None,
     ) -> APIResponse:
         """Make a mock API request"""
         self.requests.append(
-            {"method": method.value, "path": path, "body": body, "headers": headers or {}}
+            {
+                "method": method,
+                "path": path,
+                "body": body,
+                "headers": headers if headers is not None else _EMPTY_HEADERS,
+            }
         )
 
-        # Simulate different endpoints
-        if path == "/health":
-            return APIResponse(200, {"status": "healthy"}, {}, 5.0)
-
-        elif path == "/api/metrics/cognitive":
-            return APIResponse(
-                200,
-                {
-                    "trust_score": 0.85,
-                    "drift_risk": 0.1,
-                    "reliability": 0.9,
-                    "hallucination_risk": 0.05,
-                },
-                {},
-                25.0,
-            )
-
-        elif path == "/api/dashboard/summary":
-            return APIResponse(
-                200,
-                {"total_models": 12, "healthy_services": 28, "alerts": {"total": 5, "critical": 1}},
-                {},
-                50.0,
-            )
-
-        elif path.startswith("/api/ingestion/"):
-            if method == HTTPMethod.POST:
-                return APIResponse(202, {"accepted": True, "id": "ing_123"}, {}, 30.0)
-
-        elif path == "/api/assistant/query":
-            if method == HTTPMethod.POST:
-                return APIResponse(
-                    200, {"response": "Here's the analysis...", "confidence": 0.9}, {}, 200.0
-                )
-
-        # Default 404
-        return APIResponse(404, {"error": "Not found"}, {}, 5.0)
+        return _dispatch(path, method)
 
     async def get(self, path: str, headers: Optional[Dict] = None) -> APIResponse:
-        return await self.request(HTTPMethod.GET, path, headers=headers)
+        return await self.request(_GET, path, headers=headers)
 
     async def post(self, path: str, body: Dict, headers: Optional[Dict] = None) -> APIResponse:
-        return await self.request(HTTPMethod.POST, path, body=body, headers=headers)
+        return await self.request(_POST, path, body=body, headers=headers)
+
+
+def _build_dispatch():
+    """Compile the route tables into one straight-line dispatcher.
+
+    Generates an if/elif chain over the exact paths (interned, so == on
+    a repeated request string short-circuits on pointer identity before
+    falling back to a character compare; a raw `is` would break for
+    paths built at runtime), then the startswith prefix fallbacks, then
+    the 404. Codegen runs once at import; per-request cost is just the
+    chain itself with every response bound as a local constant.
+    """
+    ns: Dict[str, Any] = {"_NOT_FOUND_RESPONSE": _NOT_FOUND_RESPONSE}
+    lines = ["def _dispatch(path, method):"]
+    branch = "if"
+    for i, (route_path, (required, response)) in enumerate(MockAPIClient._ROUTES.items()):
+        ns[f"_p{i}"] = sys.intern(route_path)
+        ns[f"_r{i}"] = response
+        if required is None:
+            lines.append(f"    {branch} path == _p{i}:")
+            lines.append(f"        return _r{i}")
+        else:
+            ns[f"_m{i}"] = required
+            lines.append(f"    {branch} path == _p{i}:")
+            lines.append(f"        return _r{i} if method == _m{i} else _NOT_FOUND_RESPONSE")
+        branch = "elif"
+    for i, (prefix, required, response) in enumerate(MockAPIClient._PREFIX_ROUTES):
+        ns[f"_pre{i}"] = prefix
+        ns[f"_pr{i}"] = response
+        lines.append(f"    {branch} path.startswith(_pre{i}):")
+        if required is None:
+            lines.append(f"        return _pr{i}")
+        else:
+            ns[f"_pm{i}"] = required
+            lines.append(f"        return _pr{i} if method == _pm{i} else _NOT_FOUND_RESPONSE")
+        branch = "elif"
+    lines.append("    return _NOT_FOUND_RESPONSE")
+    exec(compile("\n".join(lines), "<route dispatch>", "exec"), ns)
+    return ns["_dispatch"]
+
+
+_dispatch = _build_dispatch()
 
 
 # =============================================================================
@@ -113,6 +201,12 @@ class MockAPIClient:
 class RequestValidator:
     """Validates API request format and content"""
 
+    # All state is class-level; empty slots keep instances dict-free
+    __slots__ = ()
+
+    # O(1) membership instead of a tuple scan (and a fresh tuple) per log
+    _LOG_LEVELS = frozenset({"debug", "info", "warning", "error", "critical"})
+
     @staticmethod
     def validate_metric_request(data: Dict) -> List[str]:
         """Validate metric ingestion request"""
@@ -146,7 +240,7 @@ class RequestValidator:
                 errors.append(f"logs[{i}]: Missing 'message'")
             if "level" not in log:
                 errors.append(f"logs[{i}]: Missing 'level'")
-            elif log["level"] not in ("debug", "info", "warning", "error", "critical"):
+            elif log["level"] not in RequestValidator._LOG_LEVELS:
                 errors.append(f"logs[{i}]: Invalid log level")
 
         return errors
@@ -172,25 +266,55 @@ class RequestValidator:
 class ResponseValidator:
     """Validates API response format and content"""
 
+    __slots__ = ()
+
+    _STATUSES = frozenset({"healthy", "degraded", "unhealthy"})
+    _COGNITIVE_FIELDS = ("trust_score", "drift_risk", "reliability", "hallucination_risk")
+
+    # Validation results memoized by object identity: the canned response
+    # bodies are module-level constants, so the same object is validated
+    # over and over. One memo per validator (the same dict can be fed to
+    # both); entries keep a strong reference to the payload so its id()
+    # cannot be recycled by another object.
+    _health_memo: Dict[int, tuple] = {}
+    _cognitive_memo: Dict[int, tuple] = {}
+
+    @staticmethod
+    def _memoized(memo: Dict[int, tuple], data: Dict) -> Optional[List[str]]:
+        hit = memo.get(id(data))
+        if hit is not None and hit[0] is data:
+            return list(hit[1])
+        return None
+
     @staticmethod
     def validate_health_response(data: Dict) -> List[str]:
         """Validate health check response"""
+        memo = ResponseValidator._health_memo
+        cached = ResponseValidator._memoized(memo, data)
+        if cached is not None:
+            return cached
+
         errors = []
 
         if "status" not in data:
             errors.append("Missing 'status' field")
-        elif data["status"] not in ("healthy", "degraded", "unhealthy"):
+        elif data["status"] not in ResponseValidator._STATUSES:
             errors.append("Invalid status value")
 
+        memo[id(data)] = (data, tuple(errors))
         return errors
 
     @staticmethod
     def validate_cognitive_response(data: Dict) -> List[str]:
         """Validate cognitive metrics response"""
+        memo = ResponseValidator._cognitive_memo
+        cached = ResponseValidator._memoized(memo, data)
+        if cached is not None:
+            return cached
+
         errors = []
 
-        required_fields = ["trust_score", "drift_risk", "reliability", "hallucination_risk"]
-        for field in required_fields:
+        for field in ResponseValidator._COGNITIVE_FIELDS:
             if field not in data:
                 errors.append(f"Missing '{field}' field")
             elif not isinstance(data[field], (int, float)):
@@ -198,6 +322,7 @@ class ResponseValidator:
             elif not 0 <= data[field] <= 1:
                 errors.append(f"'{field}' must be between 0 and 1")
 
+        memo[id(data)] = (data, tuple(errors))
         return errors
 
 
@@ -209,48 +334,40 @@ class ResponseValidator:
 class TestHealthEndpoint:
     """Tests for health check endpoint"""
 
-    @pytest.fixture
-    def client(self):
-        return MockAPIClient()
-
-    def test_health_returns_200(self, client):
+    async def test_health_returns_200(self, client):
         """Health endpoint should return 200"""
-        response = run_async(client.get("/health"))
+        response = await client.get("/health")
         assert response.status_code == 200
 
-    def test_health_response_valid(self, client):
+    async def test_health_response_valid(self, client):
         """Health response should be valid"""
-        response = run_async(client.get("/health"))
+        response = await client.get("/health")
         errors = ResponseValidator.validate_health_response(response.body)
         assert len(errors) == 0
 
-    def test_health_fast_response(self, client):
+    async def test_health_fast_response(self, client):
         """Health check should be fast"""
-        response = run_async(client.get("/health"))
+        response = await client.get("/health")
         assert response.elapsed_ms < 100  # < 100ms
 
 
 class TestCognitiveMetricsEndpoint:
     """Tests for cognitive metrics endpoint"""
 
-    @pytest.fixture
-    def client(self):
-        return MockAPIClient()
-
-    def test_cognitive_returns_200(self, client):
+    async def test_cognitive_returns_200(self, client):
         """Cognitive endpoint should return 200"""
-        response = run_async(client.get("/api/metrics/cognitive"))
+        response = await client.get("/api/metrics/cognitive")
         assert response.status_code == 200
 
-    def test_cognitive_response_valid(self, client):
+    async def test_cognitive_response_valid(self, client):
         """Cognitive response should be valid"""
-        response = run_async(client.get("/api/metrics/cognitive"))
+        response = await client.get("/api/metrics/cognitive")
         errors = ResponseValidator.validate_cognitive_response(response.body)
         assert len(errors) == 0
 
-    def test_cognitive_contains_trust_score(self, client):
+    async def test_cognitive_contains_trust_score(self, client):
         """Response should contain trust score"""
-        response = run_async(client.get("/api/metrics/cognitive"))
+        response = await client.get("/api/metrics/cognitive")
         assert "trust_score" in response.body
         assert 0 <= response.body["trust_score"] <= 1
 
@@ -258,18 +375,14 @@ class TestCognitiveMetricsEndpoint:
 class TestIngestionEndpoint:
     """Tests for data ingestion endpoints"""
 
-    @pytest.fixture
-    def client(self):
-        return MockAPIClient()
-
-    def test_metric_ingestion_accepts_valid(self, client):
+    async def test_metric_ingestion_accepts_valid(self, client):
         """Should accept valid metric data"""
         data = {
             "metadata": {"source_id": "test", "timestamp": datetime.utcnow().isoformat()},
             "metrics": [{"name": "cpu_usage", "value": 45.5, "labels": {"host": "server1"}}],
         }
 
-        response = run_async(client.post("/api/ingestion/metrics", data))
+        response = await client.post("/api/ingestion/metrics", data)
         assert response.status_code == 202
 
     def test_metric_validation_rejects_invalid(self):
@@ -304,24 +417,16 @@ class TestIngestionEndpoint:
 class TestAssistantEndpoint:
     """Tests for AI assistant endpoint"""
 
-    @pytest.fixture
-    def client(self):
-        return MockAPIClient()
-
-    def test_assistant_query(self, client):
+    async def test_assistant_query(self, client):
         """Should handle assistant queries"""
-        response = run_async(
-            client.post("/api/assistant/query", {"query": "What is the current system health?"})
-        )
+        response = await client.post("/api/assistant/query", {"query": "What is the current system health?"})
 
         assert response.status_code == 200
         assert "response" in response.body
 
-    def test_assistant_has_confidence(self, client):
+    async def test_assistant_has_confidence(self, client):
         """Assistant response should include confidence"""
-        response = run_async(
-            client.post("/api/assistant/query", {"query": "Explain the recent drift detection"})
-        )
+        response = await client.post("/api/assistant/query", {"query": "Explain the recent drift detection"})
 
         assert "confidence" in response.body
 
@@ -329,13 +434,9 @@ class TestAssistantEndpoint:
 class TestDashboardEndpoint:
     """Tests for dashboard data endpoint"""
 
-    @pytest.fixture
-    def client(self):
-        return MockAPIClient()
-
-    def test_dashboard_summary(self, client):
+    async def test_dashboard_summary(self, client):
         """Should return dashboard summary"""
-        response = run_async(client.get("/api/dashboard/summary"))
+        response = await client.get("/api/dashboard/summary")
 
         assert response.status_code == 200
         assert "total_models" in response.body
@@ -357,19 +458,22 @@ class TestRateLimiting:
             def __init__(self, max_requests: int, window_seconds: int):
                 self.max_requests = max_requests
                 self.window_seconds = window_seconds
-                self.requests: List[datetime] = []
+                # Monotonic floats in arrival order: expiry pops from the
+                # left in O(1) amortized, no timedelta per comparison
+                self.requests: deque = deque()
 
             def is_allowed(self) -> bool:
-                now = datetime.utcnow()
+                # One cutoff subtraction per call instead of one per
+                # retained entry
+                cutoff = time.monotonic() - self.window_seconds
                 # Remove old requests
-                self.requests = [
-                    r for r in self.requests if (now - r).total_seconds() < self.window_seconds
-                ]
+                while self.requests and self.requests[0] <= cutoff:
+                    self.requests.popleft()
 
                 if len(self.requests) >= self.max_requests:
                     return False
 
-                self.requests.append(now)
+                self.requests.append(cutoff + self.window_seconds)
                 return True
 
         limiter = RateLimiter(max_requests=10, window_seconds=60)
@@ -388,14 +492,12 @@ class TestRateLimiting:
             def __init__(self, max_requests: int, window_seconds: int):
                 self.max_requests = max_requests
                 self.window_seconds = window_seconds
-                self.requests: List[datetime] = []
+                self.requests: deque = deque()
 
-            def is_allowed(self, current_time: datetime) -> bool:
-                self.requests = [
-                    r
-                    for r in self.requests
-                    if (current_time - r).total_seconds() < self.window_seconds
-                ]
+            def is_allowed(self, current_time: float) -> bool:
+                cutoff = current_time - self.window_seconds
+                while self.requests and self.requests[0] <= cutoff:
+                    self.requests.popleft()
 
                 if len(self.requests) >= self.max_requests:
                     return False
@@ -404,17 +506,69 @@ class TestRateLimiting:
                 return True
 
         limiter = RateLimiter(max_requests=5, window_seconds=60)
-        now = datetime.utcnow()
+
+        # The limiter is fully driven by the injected clock, so plain
+        # float offsets from zero keep the test deterministic and skip
+        # the time.monotonic() call entirely
+        now = 0.0
 
         # Exhaust limit
         for i in range(5):
-            assert limiter.is_allowed(now + timedelta(seconds=i))
+            assert limiter.is_allowed(now + i)
 
         # Should be blocked
-        assert not limiter.is_allowed(now + timedelta(seconds=10))
+        assert not limiter.is_allowed(now + 10)
 
         # Should be allowed after window
-        assert limiter.is_allowed(now + timedelta(seconds=120))
+        assert limiter.is_allowed(now + 120)
+
+    def test_rate_limit_bitmap_window(self):
+        """Fixed-slot limiter packed into a single 64-bit mask"""
+
+        class BitmapRateLimiter:
+            """One bit per time slot, newest slot at bit 0.
+
+            Advancing the window is one shift and admission is one
+            popcount via int.bit_count() -- no per-request timestamps
+            retained. Trades the deque's exact sliding window for O(1)
+            state: at most one request per slot, 64 slots of history.
+            """
+
+            _WINDOW_MASK = (1 << 64) - 1
+
+            def __init__(self, max_requests: int):
+                self.max_requests = max_requests
+                self.slots = 0
+                self.current_slot = 0
+
+            def is_allowed(self, slot: int) -> bool:
+                delta = slot - self.current_slot
+                if delta > 0:
+                    # Old slots fall off the high end of the mask
+                    self.slots = (self.slots << delta) & self._WINDOW_MASK
+                    self.current_slot = slot
+
+                if self.slots & 1 or self.slots.bit_count() >= self.max_requests:
+                    return False
+
+                self.slots |= 1
+                return True
+
+        limiter = BitmapRateLimiter(max_requests=3)
+
+        # One request per slot up to the quota
+        assert limiter.is_allowed(0)
+        assert limiter.is_allowed(1)
+        assert limiter.is_allowed(2)
+
+        # Same slot again: its bit is already set
+        assert not limiter.is_allowed(2)
+
+        # Next slot: three bits still inside the 64-slot window
+        assert not limiter.is_allowed(3)
+
+        # Once the old slots shift out of the mask, capacity returns
+        assert limiter.is_allowed(3 + 64)
 
 
 # =============================================================================
@@ -458,13 +612,9 @@ class TestAuthentication:
 class TestErrorHandling:
     """Tests for API error handling"""
 
-    @pytest.fixture
-    def client(self):
-        return MockAPIClient()
-
-    def test_404_for_unknown_path(self, client):
+    async def test_404_for_unknown_path(self, client):
         """Should return 404 for unknown paths"""
-        response = run_async(client.get("/api/nonexistent"))
+        response = await client.get("/api/nonexistent")
         assert response.status_code == 404
 
     def test_error_response_format(self):
@@ -488,32 +638,30 @@ class TestErrorHandling:
 class TestEndToEndFlows:
     """Tests for complete API flows"""
 
-    @pytest.fixture
-    def client(self):
-        return MockAPIClient()
-
-    def test_ingest_and_query_flow(self, client):
-        """Complete flow: ingest data, then query"""
-        # Step 1: Ingest metric
-        ingest_response = run_async(
+    async def test_ingest_and_query_flow(self, client):
+        """Complete flow: ingest data and query cognitive metrics"""
+        # The two calls don't depend on each other's result, so issue
+        # them concurrently (gather, not TaskGroup: the project floor is
+        # Python 3.10)
+        ingest_response, query_response = await asyncio.gather(
             client.post(
-                "/api/ingestion/metrics", {"metrics": [{"name": "test_metric", "value": 42.0}]}
-            )
+                "/api/ingestion/metrics",
+                {"metrics": [{"name": "test_metric", "value": 42.0}]},
+            ),
+            client.get("/api/metrics/cognitive"),
         )
-        assert ingest_response.status_code == 202
 
-        # Step 2: Query cognitive metrics
-        query_response = run_async(client.get("/api/metrics/cognitive"))
+        assert ingest_response.status_code == 202
         assert query_response.status_code == 200
 
-    def test_health_before_operations(self, client):
+    async def test_health_before_operations(self, client):
         """Should check health before operations"""
         # Check health first
-        health = run_async(client.get("/health"))
+        health = await client.get("/health")
 
         if health.body.get("status") == "healthy":
             # Proceed with operations
-            response = run_async(client.get("/api/dashboard/summary"))
+            response = await client.get("/api/dashboard/summary")
             assert response.status_code == 200
 
 
@@ -525,32 +673,27 @@ class TestEndToEndFlows:
 class TestConcurrentRequests:
     """Tests for concurrent API requests"""
 
-    @pytest.fixture
-    def client(self):
-        return MockAPIClient()
-
-    def test_parallel_requests(self, client):
+    async def test_parallel_requests(self, client):
         """Should handle parallel requests"""
 
-        async def run_parallel():
-            # Create multiple concurrent requests
-            tasks = [
-                client.get("/api/metrics/cognitive"),
-                client.get("/api/dashboard/summary"),
-                client.get("/health"),
-            ]
-            return await asyncio.gather(*tasks)
-
-        responses = run_async(run_parallel())
+        # gather schedules the requests concurrently; TaskGroup would be
+        # marginally leaner but needs Python 3.11 and the project floor
+        # is 3.10
+        responses = await asyncio.gather(
+            *(
+                client.get(path)
+                for path in ("/api/metrics/cognitive", "/api/dashboard/summary", "/health")
+            )
+        )
 
         # All should succeed
         assert all(r.status_code in (200, 202) for r in responses)
 
-    def test_request_ordering(self, client):
+    async def test_request_ordering(self, client):
         """Should maintain request order tracking"""
-        run_async(client.get("/health"))
-        run_async(client.get("/api/metrics/cognitive"))
-        run_async(client.get("/api/dashboard/summary"))
+        await client.get("/health")
+        await client.get("/api/metrics/cognitive")
+        await client.get("/api/dashboard/summary")
 
         assert len(client.requests) == 3
         assert client.requests[0]["path"] == "/health"
@@ -565,23 +708,19 @@ class TestConcurrentRequests:
 class TestResponseTimes:
     """Tests for API response times"""
 
-    @pytest.fixture
-    def client(self):
-        return MockAPIClient()
-
-    def test_health_under_50ms(self, client):
+    async def test_health_under_50ms(self, client):
         """Health check should be under 50ms"""
-        response = run_async(client.get("/health"))
+        response = await client.get("/health")
         assert response.elapsed_ms < 50
 
-    def test_dashboard_under_100ms(self, client):
+    async def test_dashboard_under_100ms(self, client):
         """Dashboard should be under 100ms"""
-        response = run_async(client.get("/api/dashboard/summary"))
+        response = await client.get("/api/dashboard/summary")
         assert response.elapsed_ms < 100
 
-    def test_assistant_under_5s(self, client):
+    async def test_assistant_under_5s(self, client):
         """Assistant queries should be under 5s"""
-        response = run_async(client.post("/api/assistant/query", {"query": "Test query"}))
+        response = await client.post("/api/assistant/query", {"query": "Test query"})
         assert response.elapsed_ms < 5000
 
 